@@ -14,6 +14,18 @@ import time
 import numpy as np
 from snn_sim.run_simulation import run
 
+try:
+    from watchfiles import watch
+    WATCHFILES_AVAILABLE = True
+except ImportError:
+    WATCHFILES_AVAILABLE = False
+
+try:
+    from pyarrow import csv as pacsv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 ITERS = 1000
 ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
 
@@ -23,22 +35,93 @@ GENOME_START_INDEX = 3
 HIDDEN_SIZES = [2]
 GENOME_FOLDER = Path(os.path.join(PARENTDIR,"data","latest_genome"))
 
+# Per-file parse cache: {path: {"mtime", "size", "df"}}. Lets each refresh
+# parse only the rows appended since the previous read.
+_csv_cache = {}
+
+
+def read_csv_full(path):
+    """
+    Parse a whole genome CSV, using pyarrow's multithreaded reader for the
+    wide float columns when available and pandas otherwise.
+    """
+    if PYARROW_AVAILABLE:
+        table = pacsv.read_csv(
+            path,
+            read_options=pacsv.ReadOptions(use_threads=True,
+                                           block_size=1 << 20))
+        return table.to_pandas()
+
+    return pd.read_csv(path)
+
+
+def try_read_genome_csv(path):
+    """
+    Read a genome CSV, returning its dataframe if it contains valid
+    'best_fitness' data and None otherwise.
+
+    Results are cached per file: an unchanged mtime skips the parse
+    entirely, and a grown file only parses the newly appended rows.
+    """
+    key = str(path)
+
+    try:
+        mtime = os.path.getmtime(path)
+        size = os.path.getsize(path)
+        cached = _csv_cache.get(key)
+
+        if cached is not None and cached["mtime"] == mtime:
+            df = cached["df"]
+        elif cached is not None and size >= cached["size"]:
+            # Append-only growth: skip the rows we already hold.
+            new_rows = pd.read_csv(path,
+                                   skiprows=range(1, len(cached["df"]) + 1))
+            if len(new_rows) > 0:
+                df = pd.concat([cached["df"], new_rows], ignore_index=True)
+            else:
+                df = cached["df"]
+            _csv_cache[key] = {"mtime": mtime, "size": size, "df": df}
+        else:
+            # First read, or the file was rewritten from scratch.
+            df = read_csv_full(path)
+            _csv_cache[key] = {"mtime": mtime, "size": size, "df": df}
+
+        if not df.empty and "best_fitness" in df.columns:
+            _ = df["best_fitness"].min()
+            return df
+    except Exception:
+        pass
+
+    return None
+
+
 def wait_for_file(path):
     """
     Wait for a file to be created and contain valid 'best_fitness' data.
+
+    Blocks on OS file-change events via watchfiles when available, so the
+    CSV is only re-parsed when it actually changes. Falls back to polling
+    every five seconds when watchfiles is not installed.
     """
-    while True:
-        try:
-            df = pd.read_csv(path)
-            if not df.empty and "best_fitness" in df.columns:
-                _ = min(df["best_fitness"])
+    df = try_read_genome_csv(path)
+    if df is not None:
+        return df
+
+    if WATCHFILES_AVAILABLE:
+        print(f"Waiting for valid file: {path}")
+        for _ in watch(os.path.dirname(path)):
+            df = try_read_genome_csv(path)
+            if df is not None:
                 return df
-        except Exception:
-            pass
 
+    while True:
         print(f"Waiting for valid file: {path}")
         time.sleep(5)
 
+        df = try_read_genome_csv(path)
+        if df is not None:
+            return df
+
 
 def get_best_from_all_csvs():
     """
@@ -52,12 +135,12 @@ def get_best_from_all_csvs():
         df = wait_for_file(csv_file)
 
         try:
-            current_best = df.loc[df["best_fitness"] == min(df["best_fitness"])]
-            current_fitness = current_best["best_fitness"].values[0]
+            best_idx = df["best_fitness"].idxmin()
+            current_fitness = df.at[best_idx, "best_fitness"]
 
             if current_fitness < best_fitness:
                 best_fitness = current_fitness
-                best_row = current_best
+                best_row = df.loc[[best_idx]]
                 best_file = csv_file
 
         except Exception as e:
@@ -72,18 +155,27 @@ def visualize_best(mode, logs, hidden_sizes, input_method):
     """
     os.makedirs("data", exist_ok=True)
 
+    # Last individual shown, so idle refreshes don't re-run the simulation
+    last_shown = None
+
     while True:
 
         best_row, source_file = get_best_from_all_csvs()
 
         if best_row is not None:
             try:
-                genome = best_row.values.tolist()[0][GENOME_START_INDEX:]
-                generation = int(best_row.values.tolist()[0][0])
+                genome = best_row.iloc[0, GENOME_START_INDEX:].to_numpy(
+                    dtype=np.float64)
+                generation = int(best_row.iat[0, 0])
+
+                if (source_file, generation) == last_shown:
+                    time.sleep(5)
+                    continue
+
                 this_dir = pathlib.Path(__file__).parent.resolve()
                 vid_path = os.path.join(this_dir, "data", "videos")
 
-                print(f"\n\n\nFitness: {min(best_row['best_fitness'])}")
+                print(f"\n\n\nFitness: {best_row['best_fitness'].iloc[0]}")
                 print(f"From file: {source_file.name}")
 
                 vid_name = source_file.stem + "_gen_" + str(generation)
@@ -100,6 +192,7 @@ def visualize_best(mode, logs, hidden_sizes, input_method):
                     run(ITERS, genome, mode, hidden_sizes, None, None, logs, log_filename, snn_input_method=input_method)
                     if logs:
                         quit()
+                    last_shown = (source_file, generation)
             except Exception as e:
                 print("Error during run:", e)
                 continue
@@ -9,6 +9,7 @@ April 16th, 2025
 """
 
 import os
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
@@ -41,18 +42,21 @@ def plot_neuron_logs(df, xlim, snn_id, layer, neuron_id):
 
     steps = range(len(logs['levellog']))
 
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8), sharex=True, gridspec_kw={'height_ratios': [3, 1]})
+    # Reuse one named figure across repeated calls rather than allocating
+    # a fresh one (and its backend state) on every refresh.
+    fig = plt.figure('neuron_logs', figsize=(12, 8))
+    fig.clf()
+    ax1, ax2 = fig.subplots(2, 1, sharex=True, gridspec_kw={'height_ratios': [3, 1]})
 
     if logs['levellog'] is not None:
         ax1.plot(steps, logs['levellog'], label='Activation Level (levellog)', alpha=0.7)
 
     if logs['firelog'] is not None:
-        spike_steps = [i for i, v in enumerate(logs['firelog']) if v > 0]
+        spike_steps = np.nonzero(logs['firelog'] > 0)[0]
         ymin, ymax = ax1.get_ylim()
         spike_ymin = ymin + 0.05 * (ymax - ymin)
         spike_ymax = spike_ymin + 0.1 * (ymax - ymin)
-        for spike in spike_steps:
-            ax1.vlines(x=spike, ymin=spike_ymin, ymax=spike_ymax, color='red', linewidth=1.5)
+        ax1.vlines(spike_steps, ymin=spike_ymin, ymax=spike_ymax, color='red', linewidth=1.5)
 
     ax1.set_ylabel('Activation Level')
     ax1.set_title(f'SNN {snn_id} | Layer: {layer} | Neuron: {neuron_id}')
@@ -79,18 +83,19 @@ def plot_snn_spiketrains(df, xlim, snn_id):
     num_neurons = len(snn_df)
     palette = sns.color_palette("husl", num_neurons)
 
-    plt.figure(figsize=(12, num_neurons * 0.5 + 2))
+    plt.figure('snn_spiketrains', figsize=(12, num_neurons * 0.5 + 2))
+    plt.clf()
 
-    yticks = []
-    yticklabels = []
+    # One (neurons, steps) bool matrix and a single vlines call build one
+    # collection for the whole raster instead of one per neuron.
+    spikes = snn_df.iloc[:, 4:].to_numpy(dtype=float) > 0
+    n_idx, t_idx = np.nonzero(spikes)
+    plt.vlines(t_idx, n_idx, n_idx + 1,
+               colors=[palette[i] for i in n_idx], linewidth=1.5)
 
-    for idx, (_, row) in enumerate(snn_df.iterrows()):
-        spikes = row.iloc[4:].astype(float).values
-        spike_steps = [i for i, v in enumerate(spikes) if v > 0]
-        plt.vlines(spike_steps, idx, idx + 1, color=palette[idx], linewidth=1.5)
-
-        yticks.append(idx + 0.5)
-        yticklabels.append(f"{row['layer']}-{row['neuron']}")
+    yticks = np.arange(num_neurons) + 0.5
+    yticklabels = [f"{row['layer']}-{row['neuron']}"
+                   for _, row in snn_df.iterrows()]
 
     plt.yticks(yticks, yticklabels)
     plt.xlabel('Timestep')
@@ -105,7 +110,8 @@ def plot_snn_activation_levels(df, xlim, snn_id):
     """Plot activation levels for all neurons in an SNN."""
     snn_df = df[(df['SNN'] == snn_id) & (df['log'] == 'levellog')]
 
-    plt.figure(figsize=(12, 6))
+    plt.figure('snn_activation_levels', figsize=(12, 6))
+    plt.clf()
 
     for _, row in snn_df.iterrows():
         levels = row.iloc[4:].astype(float).values
@@ -126,7 +132,8 @@ def plot_snn_dutycycles(df, xlim, snn_id):
     """Plot duty cycles for all neurons in an SNN."""
     snn_df = df[(df['SNN'] == snn_id) & (df['log'] == 'dutycyclelog')]
 
-    plt.figure(figsize=(12, 6))
+    plt.figure('snn_dutycycles', figsize=(12, 6))
+    plt.clf()
 
     for _, row in snn_df.iterrows():
         duty = row.iloc[4:].astype(float).values
@@ -173,11 +180,9 @@ def plot_fitness_over_time(experiment_path):
 
     for file in run_files:
         try:
-            df = pd.read_csv(file)
-            if 'generation' in df.columns and 'best_so_far' in df.columns:
-                df = df[['generation', 'best_so_far']]
-                df['run'] = file.name
-                all_data.append(df)
+            df = pd.read_csv(file, usecols=['generation', 'best_so_far'])
+            df['run'] = file.name
+            all_data.append(df)
         except Exception as e:
             print(f"Could not read {file}: {e}")
 
@@ -197,12 +202,12 @@ def plot_fitness_over_time(experiment_path):
         df = all_data[0]
         plt.plot(df['generation'], df['best_so_far'], label="Best Fitness", linewidth=2, color=best_color)
     else:
-        stats = combined.groupby('generation')['best_so_far'].agg([
-            'mean', 'min', lambda x: x.quantile(0.25), lambda x: x.quantile(0.75)
-        ]).rename(columns={
-            '<lambda_0>': 'q25',
-            '<lambda_1>': 'q75'
-        }).reset_index()
+        grouped = combined.groupby('generation')['best_so_far']
+        stats = grouped.agg(['mean', 'min'])
+        quartiles = grouped.quantile([0.25, 0.75]).unstack()
+        stats['q25'] = quartiles[0.25]
+        stats['q75'] = quartiles[0.75]
+        stats = stats.reset_index()
 
         plt.plot(stats['generation'], stats['mean'], marker='o', label="Mean Best Fitness", linewidth=2, color=avg_color)
         plt.plot(stats['generation'], stats['min'], marker='o', label="Overall Best Fitness", color=best_color)
@@ -46,7 +46,7 @@ def run_indvididual(generation, mode, filename, logs, hidden_sizes):
     
     df = pd.read_csv(csv_path)
     row = df.loc[(df['generation']==generation-1)] # W have a 0 index generation which is actually our 1st
-    genome = row.values.tolist()[0][GENOME_START_INDEX:]
+    genome = row.iloc[0, GENOME_START_INDEX:].to_numpy()
 
     # Generate video name using times
     vid_path = os.path.join(this_dir, "data", "videos")
@@ -54,7 +54,7 @@ def run_indvididual(generation, mode, filename, logs, hidden_sizes):
     vid_name = real_filename + "_gen_" + str(generation)
 
     run(ITERS, genome, mode, hidden_sizes, vid_name, vid_path, logs, (real_filename + ".csv"))
-    print(f"\n\n\nFitness: ", row.values.tolist()[0][2])
+    print(f"\n\n\nFitness: ", row.iat[0, 2])
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='RL')
@@ -6,116 +6,69 @@ Modified by: Hades Panlilio
 """
 
 import numpy as np
-from snn.ring_buffer import RingBuffer
+from snn import _kernels
 
 # Constants
 SPIKE_DECAY_DEFAULT = 0.01
 MAX_BIAS = 1
 MAX_FIRELOG_SIZE = 10
+LEVELS_LOG_SIZE = 1000  # Matches the simulation step count; oldest levels roll off
 
 class SpikyNode:
     """
     Class representing a spiky neuron.
+
+    A thin per-neuron view into its layer's weight matrix and logs. All
+    state lives in the owning SpikyLayer; this class just exposes the
+    old single-neuron interface against that shared storage.
     """
 
-    def __init__(self, size, spike_decay=SPIKE_DECAY_DEFAULT):
+    def __init__(self, layer, index):
         """
-        Initializes a spike neuron.
+        Initializes a spike neuron view.
 
         Parameters:
-            size (int): Number of weights plus the bias.
-            spike_decay (float): Spike decay rate for neurons.
-        """
-        # a list of weights and a bias (last item in the list)
-
-        self._weights = np.random.uniform(-0.3, 0.3, (size + 1))
-        self.level = 0  # activation level
-        self.buffer = RingBuffer(
-            MAX_FIRELOG_SIZE)  # tracks whether the neuron fired or not
-        self.spike_decay = spike_decay
-        self.levels_log = []
-        self.fire_log = []
-        self.duty_cycle_log = []
-
-    def compute(self, inputs):
+            layer (SpikyLayer): The layer holding this neuron's state.
+            index (int): This neuron's row in the layer's arrays.
         """
-        Compute the neuron's output based on inputs.
-        
-        Parameters:
-            inputs (list): Inputs into this node.
+        self._layer = layer
+        self._index = index
 
-        Returns:
-            tuple: (1.0 if the neuron fired, 0.0 otherwise,
-                    the neuron's current level).
-        """
-
-        self.level *= (1 - self.spike_decay)
-
-        if (len(inputs) + 1) != len(self._weights):
-            print(f"Error: {len(inputs)} inputs vs {len(self._weights)} \
-                  weights; weights: {self._weights}")
-            return 0.0, self.level
-
-        weighted_sum = sum(inputs[i] * self._weights[i]
-                           for i in range(len(inputs)))
-        
-        self.level += weighted_sum
-
-        self.levels_log.append(self.level)
-
-        if self.level >= self.get_bias(): # Neuron fires
-
-            self.level = 0
-            self.fire_log.append(1)
-            self.buffer.add(1)
-            self.duty_cycle_log.append(self.duty_cycle())
-            return 1.0, self.level
-        else:                             # Neuron doesn't fire
-            
-            self.fire_log.append(0)
-            self.buffer.add(0)
-            self.duty_cycle_log.append(self.duty_cycle())
-            return 0.0, self.level
+    @property
+    def level(self):
+        """Get the neuron's current activation level."""
+        return self._layer.level[self._index]
 
     def duty_cycle(self):
         """
         Measures how frequently the neuron fires.
 
-        Parameters:
-            window (int): How far back to compute the duty cycle.
-
         Returns:
             float: What pecent of the last `MAX_FIRELOG_SIZE` timesteps the neuron fired, in decimal form.
         """
-        if self.buffer.length() == 0:
-            return 0.0
-
-        recent_fires = self.buffer.get()
-    
-        return recent_fires.count(1)/MAX_FIRELOG_SIZE
-
+        return self._layer.duty_cycles()[self._index]
 
     def set_weights(self, input_weights):
         """
         Sets the neuron's weights.
-        
+
         Parameters:
             input_weights (list): Incoming weights into the neuron.
         """
-        if len(input_weights) != len(self._weights):
+        weights = np.asarray(input_weights, dtype=np.float32)
+        if weights.size != self._layer.num_inputs + 1:
             print("Weight size mismatch in node")
         else:
-            self._weights = input_weights.copy()
-            self._weights[:-1] = list(map(lambda x: abs(x), self._weights[:-1]))
-            # self._weights = input_weights.copy()
+            np.abs(weights[:-1], out=self._layer.W[self._index])
+            self._layer.bias[self._index] = weights[-1]
 
     def set_bias(self, val):
         """Sets the neuron's bias.
-        
+
         Parameters:
             val (float): Value for neuron bias.
         """
-        self._weights[-1] = val
+        self._layer.bias[self._index] = val
 
     def get_bias(self):
         """
@@ -124,53 +77,64 @@ class SpikyNode:
         Returns:
             float: The neuron's bias.
         """
-        return self._weights[-1]
+        return self._layer.bias[self._index]
 
     def print_weights(self):
         """
         Prints the combined list of weights and bias.
-        
+
         Returns:
             list: A list of weights, with the last entry being the neuron's bias.
         """
-        print(self._weights)
+        print(self.weights)
 
     def get_levels_log(self):
         """
         Return the list of the neuron's recent activation levels.
-        
+
         Returns:
-            list: A list of all the neuron's levels.
+            ndarray: All of the neuron's logged levels, oldest first.
         """
-        return self.levels_log
-    
+        return self._layer.get_levels_log()[:, self._index]
+
     def get_fire_log(self):
         """
         Return the list of the neuron's firelog.
-        
+
         Returns:
             list: A list representing the neuron's firelog.
         """
         return self.fire_log
-    
+
     def get_duty_cycle_log(self):
         """
         Return the neuron's duty cycle for each timestep.
-        
+
         Returns:
             list: A list of all the neuron's duty cycles for each time step..
         """
-        return self.duty_cycle_log
+        return [step[self._index] for step in self._layer.duty_cycle_log]
+
+    @property
+    def fire_log(self):
+        """Get the list of the neuron's firelog."""
+        return [step[self._index] for step in self._layer.fire_log]
 
     @property
     def weights(self):
-        """Get the weights of the neuron."""
-        return self._weights
+        """Get the weights of the neuron, with the bias as the last entry."""
+        return np.append(self._layer.W[self._index],
+                         self._layer.bias[self._index])
 
 
 class SpikyLayer:
     """
     Collection of multiple neurons (SpikyNodes).
+
+    The layer owns a single (num_nodes, num_inputs) weight matrix, a bias
+    vector, and a level vector, so one timestep is a single matrix-vector
+    product instead of a Python loop over neurons. A boolean mask tracks
+    which neurons have accumulated since their last reset.
     """
 
     def __init__(self, num_nodes, num_inputs, spike_decay=SPIKE_DECAY_DEFAULT):
@@ -183,56 +147,130 @@ class SpikyLayer:
             spike_decay (float): Spike decay rate for neurons
         """
 
-        self.nodes = [SpikyNode(num_inputs, spike_decay)
-                      for _ in range(num_nodes)]
+        self.num_nodes = num_nodes
+        self.num_inputs = num_inputs
+        self.spike_decay = spike_decay
+
+        # float32 end to end: halves the bytes touched per matvec and the
+        # sub-threshold sums don't need double precision.
+        self.W = np.random.uniform(-0.3, 0.3,
+                                   (num_nodes, num_inputs)).astype(np.float32)
+        self.bias = np.random.uniform(-0.3, 0.3, num_nodes).astype(np.float32)
+        self.level = np.zeros(num_nodes, dtype=np.float32)
+        self.initialized = np.zeros(num_nodes, dtype=bool)
+
+        # Circular buffer of fires over the last MAX_FIRELOG_SIZE steps,
+        # plus a running count so duty cycles never rescan the window.
+        self.firelog = np.zeros((MAX_FIRELOG_SIZE, num_nodes), dtype=np.uint8)
+        self.firelog_idx = 0
+        self.fire_count = np.zeros(num_nodes, dtype=np.int32)
+        self.steps_seen = 0
+
+        # Preallocated ring of recent activation levels, one row per step
+        self.levels_log = np.empty((LEVELS_LOG_SIZE, num_nodes),
+                                   dtype=np.float32)
+        self.levels_log_idx = 0
+
+        self.fire_log = []
+        self.duty_cycle_log = []
+
+        self.nodes = [SpikyNode(self, idx) for idx in range(num_nodes)]
 
     def compute(self, inputs):
         """
         Feeds input to each node and returns their output.
-        
+
         Parameters:
-            inputs (list): A list of inputs into this layer.
+            inputs (ndarray): Inputs into this layer.
 
         Returns:
-            tuple: (a list of all neuron outputs, a list of all neuron levels)
+            tuple: (ndarray of all neuron outputs, ndarray of all neuron levels)
+        """
+
+        inputs = np.asarray(inputs, dtype=np.float32)
+
+        if inputs.shape[0] != self.num_inputs:
+            print(f"Error: {inputs.shape[0]} inputs vs {self.num_inputs} \
+                  weights per node")
+            return np.zeros(self.num_nodes, dtype=np.float32), self.level.copy()
+
+        outputs, levels = _kernels.step(self.W, self.bias, self.level,
+                                        self.initialized, self.spike_decay,
+                                        inputs)
+
+        self._record_step(outputs, levels)
+
+        return outputs, np.where(outputs > 0, 0.0, levels)
+
+    def _record_step(self, outputs, levels):
         """
+        Log one timestep's fires, levels, and duty cycles.
 
-        outputs = []
-        levels = []
+        Parameters:
+            outputs (ndarray): 1.0/0.0 fire flags for each neuron.
+            levels (ndarray): Post-accumulation level for each neuron.
+        """
+        self.levels_log[self.levels_log_idx % LEVELS_LOG_SIZE] = levels
+        self.levels_log_idx += 1
 
-        for node in self.nodes:
-            output, level = node.compute(inputs)
-            outputs.append(output)
-            levels.append(level)
+        self.fire_log.append(outputs)
 
-        return outputs, levels
+        fired_row = outputs.astype(np.uint8)
+        self.fire_count -= self.firelog[self.firelog_idx]
+        self.firelog[self.firelog_idx] = fired_row
+        self.fire_count += fired_row
+        self.firelog_idx = (self.firelog_idx + 1) % MAX_FIRELOG_SIZE
+        self.steps_seen += 1
+
+        self.duty_cycle_log.append(self.duty_cycles())
 
     def set_weights(self, input_weights):
         """
         Sets weights for all the neurons in the layer.
-        
+
         Parameters:
             input_weights (list): List of weights for all neurons in the layer.
         """
         if not self.nodes:
             return
-        weights_per_node = len(input_weights) // len(self.nodes)
-        for idx, node in enumerate(self.nodes):
-            start = idx * weights_per_node
-            end = start + weights_per_node
-            node.set_weights(input_weights[start:end])
+
+        input_weights = np.asarray(input_weights, dtype=np.float32)
+
+        if input_weights.size != self.num_nodes * (self.num_inputs + 1):
+            print("Weight size mismatch in node")
+            return
+
+        per_node = input_weights.reshape(self.num_nodes, self.num_inputs + 1)
+        np.abs(per_node[:, :-1], out=self.W)
+        self.bias[:] = per_node[:, -1]
+
+    def get_levels_log(self):
+        """
+        Return the layer's logged activation levels in chronological order.
+
+        Returns:
+            ndarray: A (steps, num_nodes) array of the last LEVELS_LOG_SIZE
+                     activation levels.
+        """
+        if self.levels_log_idx <= LEVELS_LOG_SIZE:
+            return self.levels_log[:self.levels_log_idx]
+
+        start = self.levels_log_idx % LEVELS_LOG_SIZE
+        return np.roll(self.levels_log, -start, axis=0)
 
     def duty_cycles(self):
         """
         Returns the duty cycles for the neurons in the layer.
-        
-        Parameters:
-            window (int): How many previous time steps to compute the duty cycle.
 
         Returns:
-            list: The duty cycle for each neuron in the layer.
+            ndarray: The duty cycle for each neuron in the layer.
         """
-        return [node.duty_cycle() for node in self.nodes]
+        if self.steps_seen == 0:
+            return np.zeros(self.num_nodes)
+
+        window = min(MAX_FIRELOG_SIZE, self.steps_seen)
+
+        return self.fire_count / window
 
 
 class SpikyNet:
@@ -243,7 +281,7 @@ class SpikyNet:
     def __init__(self, input_size, hidden_sizes, output_size, spike_decay=SPIKE_DECAY_DEFAULT):
         """
         Initializes network.
-        
+
         Parameters:
             input_size (int): Number of inputs into the network.
             hidden_sizes (list): List containing number of neurons in each hidden layer.
@@ -268,10 +306,28 @@ class SpikyNet:
             inputs (list): Inputs to the network.
 
         Returns:
-            tuple: (output spikes, final neuron levels)
+            tuple: (ndarray of output spikes, ndarray of final neuron levels)
         """
 
-        current_output = inputs
+        current_output = np.ascontiguousarray(inputs, dtype=np.float32)
+
+        # Single hidden layer (the usual shape): run both layers in one
+        # fused kernel call and log afterwards.
+        if len(self.hidden_layers) == 1:
+            hidden = self.hidden_layers[0]
+            out_layer = self.output_layer
+
+            hidden_out, hidden_levels, output, out_levels = _kernels.forward(
+                hidden.W, hidden.bias, hidden.level, hidden.initialized,
+                hidden.spike_decay, out_layer.W, out_layer.bias,
+                out_layer.level, out_layer.initialized, out_layer.spike_decay,
+                current_output)
+
+            hidden._record_step(hidden_out, hidden_levels)
+            out_layer._record_step(output, out_levels)
+
+            return output, np.where(output > 0, 0.0, out_levels)
+
         for layer in self.hidden_layers:
             current_output, _ = layer.compute(current_output)
 
@@ -281,7 +337,7 @@ class SpikyNet:
     def set_weights(self, input_weights):
         """
         Assigns weights to all hidden layers and the output layer.
-        
+
         Parameters:
             input_weights: A dictionary with two keys: 'hidden_layer', mapping to a list
                            of all that layer's weights and biases, and a key 'output_layer',
@@ -13,6 +13,7 @@ import pandas as pd
 import numpy as np
 import sys
 import matplotlib.pyplot as plt
+from snn import _kernels
 from snn.model_struct import SpikyNet, SPIKE_DECAY_DEFAULT
 
 # Constants for SNN configuration
@@ -73,7 +74,8 @@ class SNNController:
         robot_data = self._load_robot_file(robot_path)
 
         # Count actuators (types 3 and 4)
-        self.num_snn = sum(1 for t in robot_data["types"] if t in [3, 4])
+        self.num_snn = int(
+            np.count_nonzero(np.isin(robot_data["types"], (3, 4))))
 
         # Initialize SNN with proper dimensions
         self.snns = [
@@ -83,6 +85,49 @@ class SNNController:
                      spike_decay=self.spike_decay) for _ in range(self.num_snn)
         ]
 
+        self._build_batches()
+
+    def _build_batches(self):
+        """
+        Stack the identical per-actuator networks into (num_snn, ...) state
+        tensors so one fused kernel call per timestep covers every SNN.
+
+        Each layer's W/bias/level/initialized arrays are rebound to views
+        into the stacked tensors, so weight updates through set_weights and
+        the per-node accessors stay in sync with the batched state.
+        """
+        self._batched = self.num_snn > 0 and len(self.hidden_sizes) == 1
+
+        if not self._batched:
+            return
+
+        hidden = [snn.hidden_layers[0] for snn in self.snns]
+        output = [snn.output_layer for snn in self.snns]
+
+        self._W_h = np.stack([layer.W for layer in hidden])
+        self._b_h = np.stack([layer.bias for layer in hidden])
+        self._level_h = np.stack([layer.level for layer in hidden])
+        self._init_h = np.stack([layer.initialized for layer in hidden])
+
+        self._W_o = np.stack([layer.W for layer in output])
+        self._b_o = np.stack([layer.bias for layer in output])
+        self._level_o = np.stack([layer.level for layer in output])
+        self._init_o = np.stack([layer.initialized for layer in output])
+
+        for snn_id, (hid, out) in enumerate(zip(hidden, output)):
+            hid.W = self._W_h[snn_id]
+            hid.bias = self._b_h[snn_id]
+            hid.level = self._level_h[snn_id]
+            hid.initialized = self._init_h[snn_id]
+
+            out.W = self._W_o[snn_id]
+            out.bias = self._b_o[snn_id]
+            out.level = self._level_o[snn_id]
+            out.initialized = self._init_o[snn_id]
+
+        self._hidden_decay = hidden[0].spike_decay
+        self._out_decay = output[0].spike_decay
+
     def _load_robot_file(self, robot_path):
         """
         Loads a robot file.
@@ -120,7 +165,8 @@ class SNNController:
             ValueError: If the length of the CMA-ES output does not match the expected size.
         """
 
-        flat_vector = np.array(cmaes_out)
+        # Cast once here; the SNN runs float32 end to end.
+        flat_vector = np.asarray(cmaes_out, dtype=np.float32)
 
         # Compute parameters for each SNN
         params_per_snn = 0
@@ -179,6 +225,34 @@ class SNNController:
         """
 
         outputs = {}
+
+        if self._batched:
+            inputs_arr = np.ascontiguousarray(inputs, dtype=np.float32)
+
+            hidden_out, hidden_levels, spikes, out_levels = \
+                _kernels.forward_batch(
+                    self._W_h, self._b_h, self._level_h, self._init_h,
+                    self._hidden_decay, self._W_o, self._b_o, self._level_o,
+                    self._init_o, self._out_decay, inputs_arr)
+
+            for snn_id, snn in enumerate(self.snns):
+                snn.hidden_layers[0]._record_step(hidden_out[snn_id],
+                                                  hidden_levels[snn_id])
+                snn.output_layer._record_step(spikes[snn_id],
+                                              out_levels[snn_id])
+
+                levels = np.where(spikes[snn_id] > 0, 0.0,
+                                  out_levels[snn_id])
+                actions = [1.6 if spikes[snn_id][0] == 1 else 0.6]
+
+                outputs[snn_id] = {
+                    "target_length": actions,
+                    "outputs": spikes[snn_id][0],
+                    "levels": levels,
+                }
+
+            return outputs
+
         for snn_id, snn in enumerate(self.snns):
 
             spikes, levels = snn.compute(inputs[snn_id])
@@ -232,41 +306,25 @@ class SNNController:
         csv_header = ['SNN', "layer", 'neuron', 'log']
         csv_header.extend([f"step{i}" for i in range(steps)])
 
-        df = pd.DataFrame(columns=csv_header)
+        # Collect all rows first and build the dataframe in one shot; the
+        # log data stays in its ndarray form until then.
+        rows = []
 
-        # Iterate through logs to generate csv
         for snn_id, snn in fire_logs.items():
             for layer_name, layer in snn.items():
                 for neuron_id, fire_log_data in enumerate(layer):
-                    # Make levels log row
+                    meta = [str(snn_id), str(layer_name), str(neuron_id)]
+
                     level_log_data = level_logs[snn_id][layer_name][neuron_id]
-                    level_log_row = [
-                        str(snn_id),
-                        str(layer_name),
-                        str(neuron_id), "levellog"
-                    ]
-                    level_log_row.extend(level_log_data)
-                    df.loc[len(df)] = level_log_row
-
-                    # Make fire log row
-                    fire_log_row = [
-                        str(snn_id),
-                        str(layer_name),
-                        str(neuron_id), "firelog"
-                    ]
-                    fire_log_row.extend(fire_log_data)
-                    df.loc[len(df)] = fire_log_row
-
-                    # Make duty cycle log row
+                    rows.append(meta + ["levellog"] + list(level_log_data))
+
+                    rows.append(meta + ["firelog"] + list(fire_log_data))
+
                     duty_cycle_data = duty_cycle_logs[snn_id][layer_name][
                         neuron_id]
-                    duty_cycle_row = [
-                        str(snn_id),
-                        str(layer_name),
-                        str(neuron_id), "dutycyclelog"
-                    ]
-                    duty_cycle_row.extend(duty_cycle_data)
-                    df.loc[len(df)] = duty_cycle_row
+                    rows.append(meta + ["dutycyclelog"] + list(duty_cycle_data))
+
+        df = pd.DataFrame(rows, columns=csv_header)
 
         # Generate file
         data_folder = Path(
@@ -382,7 +440,7 @@ def compute_genome_size(robot_path, snn_input_method, hidden_sizes):
     robot_data = data["objects"][robot_key]
 
     # Count actuators (types 3 and 4)
-    num_snn = sum(1 for t in robot_data["types"] if t in [3, 4])
+    num_snn = int(np.count_nonzero(np.isin(robot_data["types"], (3, 4))))
 
     if snn_input_method == "corners":
         inp_size = 2  # Inputs are distances to two corners